@@ -265,9 +265,7 @@ class MiBaseRegressor:
 
         # first check that model is fitted, then check columns are the same
         check_is_fitted(instance, "statistics_")
-        X_cols = X.columns.tolist()
-        fit_cols = set(instance.fit_X_columns)
-        diff_fit = set(fit_cols).difference(X_cols)
+        diff_fit = set(instance.fit_X_columns).difference(X.columns)
         if diff_fit:
             err = "Same columns that were fit must appear in predict."
             raise ValueError(err)
@@ -5,7 +5,6 @@ functionality in both DataFrame imputers. The `BaseImputer` also holds the
 methods available for imputation analysis.
 """
 
-import warnings
 from autoimpute.utils import check_strategy_allowed
 from autoimpute.imputations import method_names
 from ..series import DefaultUnivarImputer, DefaultPredictiveImputer
@@ -46,7 +45,7 @@ class BaseImputer:
             |  `median` imputes missing values with the median of the series.
             |  `mode` imputes missing values with the mode of the series.
             |     Method handles more than one mode (see ModeImputer for info).
-            |  `random` imputes random choice from set of series unique vals.
+            |  `random` imputes random draw from observed values of series.
             |  `norm` imputes series w/ random draws from normal distribution.
             |     Mean and std calculated from observed values of the series.
             |  `categorical` imputes series using random draws from pmf.
@@ -233,12 +232,3 @@ class BaseImputer:
             err = "Additional params must be dict of args used to init model."
             raise ValueError(err)
         return final_params
-
-    def _check_if_single_dummy(self, col, X):
-        """Private method to check if encoding results in single cat."""
-        cats = X.columns.tolist()
-        if len(cats) == 1:
-            c = cats[0]
-            msg = f"{c} only category for feature {col}."
-            cons = f"Consider removing {col} from dataset."
-            warnings.warn(f"{msg} {cons}")
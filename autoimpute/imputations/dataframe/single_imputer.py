@@ -111,9 +111,7 @@ class SingleImputer(BaseImputer, BaseEstimator, TransformerMixin):
 
         # initial checks before transformation and check columns are the same
         check_is_fitted(self, "statistics_")
-        X_cols = X.columns.tolist()
-        fit_cols = set(self._strats.keys())
-        diff_fit = set(fit_cols).difference(X_cols)
+        diff_fit = self._strats.keys() - set(X.columns)
         if diff_fit:
             err = "Same columns that were fit must appear in transform."
             raise ValueError(err)
@@ -2,6 +2,11 @@
 
 from autoimpute.utils import check_nan_columns
 
+def _print_delete(num_records_before, num_records_after):
+    """Private method to print number of records before and after delete."""
+    print(f"Number of records before delete: {num_records_before}")
+    print(f"Number of records after delete: {num_records_after}")
+
 @check_nan_columns
 def listwise_delete(data, inplace=False, verbose=False):
     """Delete all rows from a DataFrame where any missing values exist.
@@ -32,6 +37,5 @@ def listwise_delete(data, inplace=False, verbose=False):
         data = data.dropna(inplace=False)
     num_records_after = len(data.index)
     if verbose:
-        print(f"Number of records before delete: {num_records_before}")
-        print(f"Number of records after delete: {num_records_after}")
+        _print_delete(num_records_before, num_records_after)
     return data
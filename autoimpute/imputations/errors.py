@@ -10,7 +10,8 @@ def _not_num_series(m, s):
     """Private method to detect columns of Matrix that are not categorical."""
     if not is_numeric_dtype(s):
         t = s.dtype
-        err = f"{m} not appropriate for Series {s.name} of type {t}."
+        n = getattr(s, "name", None)
+        err = f"{m} not appropriate for Series {n} of type {t}."
         raise TypeError(err)
 
 def _not_num_matrix(m, mat):
@@ -3,17 +3,30 @@
 import logging
 import numpy as np
 import pandas as pd
-from autoimpute.imputations.deletion import listwise_delete
+from autoimpute.imputations.deletion import _print_delete
 
 def _get_observed(predictors, series, verbose=False):
     """Private method to test datasets and get observed data."""
-    conc = pd.concat([predictors, series], axis=1)
+    if isinstance(predictors, pd.Series):
+        predictors = predictors.to_frame()
 
-    # perform listwise delete on predictors and series
+    # listwise delete rows missing in predictors or series w/o concatenating
     # resulting data serves as the `observed` data for fit modeling
-    predictors = listwise_delete(conc, verbose=verbose)
-    series = predictors.pop(series.name)
-    return predictors, series
+    pred_na = pd.isnull(predictors).to_numpy()
+    series_na = pd.isnull(series).to_numpy()
+    nc = predictors.columns[pred_na.all(axis=0)].tolist()
+    if series_na.all():
+        nc.append(series.name)
+    if nc:
+        err = f"All values missing in column(s) {nc}. Should be removed."
+        raise ValueError(err)
+    observed = ~(pred_na.any(axis=1) | series_na)
+    if not observed.any():
+        err = "No rows fully observed across predictors and series."
+        raise ValueError(err)
+    if verbose:
+        _print_delete(observed.size, observed.sum())
+    return predictors.loc[observed], series.loc[observed]
 
 def _neighbors(x, n, df, choose):
     al = len(df.index)
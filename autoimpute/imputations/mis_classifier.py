@@ -13,6 +13,7 @@ This practice is useful to validate models that contain truly missing data.
 import warnings
 import numpy as np
 import pandas as pd
+from pandas.api.types import is_string_dtype
 from xgboost import XGBClassifier
 from sklearn.base import clone, BaseEstimator, ClassifierMixin
 from sklearn.utils.validation import check_is_fitted
@@ -93,7 +94,44 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         # next, prep the categorical / numerical split
         # only necessary for classes that use other features
         # wont see this requirement in the single imputer
-        self.data_mi = X.isnull().astype(int)
+        # public indicators stay int64 so user arithmetic can't wrap
+        # classifiers fit on the private uint8 view of the same mask
+        mask = pd.isnull(X).to_numpy()
+        self.data_mi = pd.DataFrame(
+            mask.astype(int), index=X.index, columns=X.columns, copy=False
+        )
+        mask = mask.view(np.uint8)
+        self._mi_cols = {c: mask[:, i] for i, c in enumerate(X.columns)}
+
+        # categorical features are passed to classifiers as integer codes
+        # store categories so predict encodes new data the same way
+        self._categories = {
+            c: pd.Categorical(X[c]).categories
+            for c, dt in X.dtypes.items() if is_string_dtype(dt)
+        }
+
+        # positions of each column's predictors within the encoded array
+        self._pred_pos = {}
+        for c in cols:
+            preds = self._preds[c]
+            if preds == "all":
+                pos = [i for i, k in enumerate(cols) if k != c]
+            else:
+                preds = [preds] if isinstance(preds, str) else preds
+                pos = X.columns.get_indexer(preds)
+            self._pred_pos[c] = np.asarray(pos, dtype=np.intp)
+
+    def _encode_predictors(self, X):
+        """Private method to encode X once as a numeric array for fit cols."""
+        x = X.loc[:, self.data_mi.columns]
+
+        # encode categoricals with codes rather than a dense one-hot matrix
+        if self._categories:
+            x = x.copy()
+            for c, cats in self._categories.items():
+                codes = cats.get_indexer(x[c])
+                x[c] = np.where(codes == -1, np.nan, codes)
+        return x.values
 
     def _predictor_strategy_validator(self, X):
         """Private method to prep for prediction."""
@@ -102,11 +140,9 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         check_is_fitted(self, "statistics_")
 
         # check dataset features are the same for both fit and transform
-        X_cols = X.columns.tolist()
-        mi_cols = self.data_mi.columns.tolist()
-        diff_X = set(X_cols).difference(mi_cols)
-        diff_mi = set(mi_cols).difference(X_cols)
-        if diff_X or diff_mi:
+        X_cols = set(X.columns)
+        mi_cols = set(self.data_mi.columns)
+        if X_cols != mi_cols:
             raise ValueError("Same columns must appear in fit and predict.")
 
     @check_nan_columns
@@ -132,17 +168,14 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
         self.statistics_ = {}
 
         # iterate missingness fit using classifier and all remaining columns
+        xs = self._encode_predictors(X)
         for column in self.data_mi:
             # only fit non time-based columns...
-            if not np.issubdtype(self.data_mi[column].dtype, np.datetime64):
-                y = self.data_mi[column]
-                preds = self._preds[column]
-                if preds == "all":
-                    x = X.drop(column, axis=1)
-                else:
-                    x = X[preds]
+            if not np.issubdtype(self._mi_cols[column].dtype, np.datetime64):
+                y = self._mi_cols[column]
+                x = xs[:, self._pred_pos[column]]
                 clf = clone(self.classifier)
-                cls_fit = clf.fit(x.values, y.values, **kwargs)
+                cls_fit = clf.fit(x, y, **kwargs)
                 self.statistics_[column] = cls_fit
         return self
 
@@ -166,25 +199,24 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
 
         # predictions for each column using respective fit classifier
         self._predictor_strategy_validator(X)
+        xs = self._encode_predictors(X)
         preds_mat = []
         for column in self.data_mi:
-            if not np.issubdtype(self.data_mi[column].dtype, np.datetime64):
-                preds = self._preds[column]
-                if preds == "all":
-                    x = X.drop(column, axis=1)
-                else:
-                    x = X[preds]
+            if not np.issubdtype(self._mi_cols[column].dtype, np.datetime64):
+                x = xs[:, self._pred_pos[column]]
                 cls_fit = self.statistics_[column]
-                y_pred = cls_fit.predict(x.values, **kwargs)
+                y_pred = cls_fit.predict(x, **kwargs)
                 preds_mat.append(y_pred)
             else:
                 y_pred = np.zeros(len(self.data_mi.index))
                 preds_mat.append(y_pred)
 
         # store the predictor matrix class membership as a dataframe
-        preds_mat = np.array(preds_mat).T
-        pred_cols = [f"{cl}_pred" for cl in X.columns]
-        self.data_mi_preds = pd.DataFrame(preds_mat, columns=pred_cols)
+        preds_mat = np.column_stack(preds_mat)
+        pred_cols = [f"{cl}_pred" for cl in self.data_mi.columns]
+        self.data_mi_preds = pd.DataFrame(
+            preds_mat, index=X.index, columns=pred_cols, copy=False
+        )
         return self.data_mi_preds
 
     @check_nan_columns
@@ -206,25 +238,24 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
                 each observation.
         """
         self._predictor_strategy_validator(X)
+        xs = self._encode_predictors(X)
         preds_mat = []
         for column in self.data_mi:
-            if not np.issubdtype(self.data_mi[column].dtype, np.datetime64):
-                preds = self._preds[column]
-                if preds == "all":
-                    x = X.drop(column, axis=1)
-                else:
-                    x = X[preds]
+            if not np.issubdtype(self._mi_cols[column].dtype, np.datetime64):
+                x = xs[:, self._pred_pos[column]]
                 cls_fit = self.statistics_[column]
-                y_pred = cls_fit.predict_proba(x.values, **kwargs)[:, 1]
+                y_pred = cls_fit.predict_proba(x, **kwargs)[:, 1]
                 preds_mat.append(y_pred)
             else:
                 y_pred = np.zeros(len(self.data_mi.index))
                 preds_mat.append(y_pred)
 
         # store the predictor matrix probabilities as a dataframe
-        preds_mat = np.array(preds_mat).T
-        pred_cols = [f"{cl}_pred" for cl in X.columns]
-        self.data_mi_proba = pd.DataFrame(preds_mat, columns=pred_cols)
+        preds_mat = np.column_stack(preds_mat)
+        pred_cols = [f"{cl}_pred" for cl in self.data_mi.columns]
+        self.data_mi_proba = pd.DataFrame(
+            preds_mat, index=X.index, columns=pred_cols, copy=False
+        )
         return self.data_mi_proba
 
     def fit_predict(self, X):
@@ -279,8 +310,7 @@ class MissingnessClassifier(BaseEstimator, ClassifierMixin):
 
         # loop through missing data indicators, eval new set for missing
         for c in self.data_mi:
-            mi_c = self.data_mi[c]
-            not_mi = mi_c[mi_c == 0].index
+            not_mi = self.data_mi.index[self._mi_cols[c] == 0]
             pred_not_mi = self.data_mi_proba.loc[not_mi, f"{c}_pred"]
             pred_wrong = pred_not_mi[pred_not_mi > thresh].index
             self.test_indices[c] = pred_wrong
@@ -7,6 +7,8 @@ strategy across all the columns in a dataframe, or specify this strategy
 for a given column.
 """
 
+import numpy as np
+import pandas as pd
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
 from autoimpute.imputations.errors import _not_num_series
@@ -35,14 +37,18 @@ class MedianImputer(ISeriesImputer):
         """Fit the Imputer to the dataset and calculate the median.
 
         Args:
-            X (pd.Series): Dataset to fit the imputer.
+            X (pd.Series, np.array): Dataset to fit the imputer.
             y (None): ignored, None to meet requirements of base class
 
         Returns:
             self. Instance of the class.
         """
         _not_num_series(self.strategy, X)
-        median = X.median()
+        if isinstance(X, pd.Series):
+            arr = X.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            arr = np.asarray(X, dtype=np.float64)
+        median = np.nanmedian(arr)
         self.statistics_ = {"param": median, "strategy": self.strategy}
         return self
 
@@ -53,7 +59,7 @@ class MedianImputer(ISeriesImputer):
         in a given dataset are replaced with the respective median from fit.
 
         Args:
-            X (pd.Series): Dataset to impute missing data from fit.
+            X (pd.Series, np.array): Dataset to impute missing data from fit.
 
         Returns:
             float -- imputed dataset.
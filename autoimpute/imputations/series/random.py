@@ -8,12 +8,12 @@ dataframe, or specify this strategy for a given column.
 """
 
 import numpy as np
+import pandas as pd
 from sklearn.utils.validation import check_is_fitted
 from autoimpute.imputations import method_names
 from .base import ISeriesImputer
 methods = method_names
 # pylint:disable=attribute-defined-outside-init
-# pylint:disable=unnecessary-pass
 
 class RandomImputer(ISeriesImputer):
     """Impute missing data using random draws from observed data.
@@ -26,48 +26,107 @@ class RandomImputer(ISeriesImputer):
     # class variables
     strategy = methods.RANDOM
 
-    def __init__(self):
-        """Create an instance of the RandomImputer class."""
-        pass
+    def __init__(self, seed=None):
+        """Create an instance of the RandomImputer class.
+
+        Args:
+            seed (int, optional): seed for the imputer's random generator.
+                Default is None, in which case draws come from numpy's
+                global state, so dataframe imputers' `seed` still produces
+                reproducible results each time they transform.
+        """
+        self.seed = seed
+
+    def _get_rng(self):
+        """Private method to get the source of random draws for imputation.
+
+        If seeded, the imputer creates a numpy Generator once and reuses it
+        for every draw. Otherwise, draws come from numpy's global state.
+        """
+        if self.seed is None:
+            return np.random
+        if not hasattr(self, "_rng"):
+            self._rng = np.random.default_rng(self.seed)
+        return self._rng
 
     def fit(self, X, y=None):
-        """Fit the Imputer to the dataset and get unique observed to sample.
+        """Fit the Imputer to the dataset and get observed values to sample.
 
         Args:
-            X (pd.Series): Dataset to fit the imputer.
+            X (pd.Series, np.array): Dataset to fit the imputer.
             y (None): ignored, None to meet requirements of base class
 
         Returns:
             self. Instance of the class.
         """
 
-        # determine set of observed values to sample from
-        random = list(set(X[~X.isnull()]))
+        # keep every observed value so draws follow the empirical distribution
+        arr = np.asarray(X)
+        random = arr[~pd.isna(arr)]
         self.statistics_ = {"param": random, "strategy": self.strategy}
+
+        # (re)create the generator so each fit starts from the seed
+        if self.seed is not None:
+            self._rng = np.random.default_rng(self.seed)
         return self
 
     def impute(self, X):
         """Perform imputations using the statistics generated from fit.
 
         The transform method handles the actual imputation. Each missing value
-        in a given dataset is replaced with a random draw from unique set of
-        observed values determined during the fit stage.
+        in a given dataset is replaced with a random draw from the observed
+        values determined during the fit stage.
 
         Args:
-            X (pd.Series): Dataset to impute missing data from fit.
+            X (pd.Series, np.array): Dataset to impute missing data from fit.
 
         Returns:
             np.array -- imputed dataset
         """
-        # check if fitted and identify location of missingness
+        # check if fitted and count the missing values
         check_is_fitted(self, "statistics_")
-        ind = X[X.isnull()].index
+        n = int(pd.isna(np.asarray(X)).sum())
 
         # get the observed values and sample from them
         param = self.statistics_["param"]
-        imp = np.random.choice(param, len(ind))
+        imp = self._get_rng().choice(param, size=n, replace=True)
         return imp
 
+    def impute_many(self, X):
+        """Impute every column of a numerical matrix in one vectorized pass.
+
+        Each missing value is replaced with a random draw from the observed
+        values of its own column, the same as fitting and imputing each
+        column separately. Sorting pushes missing values to the bottom of
+        each column with missing data, so draws index straight into the
+        observed values.
+
+        Args:
+            X (pd.DataFrame, np.array): numerical data to impute.
+
+        Returns:
+            np.array -- copy of X with every missing value imputed.
+
+        Raises:
+            ValueError: column with missing data has no observed values.
+        """
+        vals = np.array(X, dtype=np.float64)
+        mask = np.isnan(vals)
+        n_obs = vals.shape[0] - mask.sum(axis=0)
+
+        # locate missing values, then draw a position from observed per col
+        rows, cols = np.nonzero(mask)
+        if np.any(n_obs[cols] == 0):
+            raise ValueError("Columns with missing data need observed values.")
+        n_cols = n_obs[cols]
+        ix = (self._get_rng().random(n_cols.size) * n_cols).astype(np.intp)
+
+        # only sort the columns that actually have missing values
+        mis_cols = np.unique(cols)
+        srt = np.sort(vals[:, mis_cols], axis=0)
+        vals[rows, cols] = srt[ix, np.searchsorted(mis_cols, cols)]
+        return vals
+
     def fit_impute(self, X, y=None):
         """Convenience method to perform fit and imputation in one go."""
         return self.fit(X, y).impute(X)
@@ -8,8 +8,10 @@ in different classes or methods where the same checks must be performed often.
 """
 
 import functools
-import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_dtype
+from pandas.api.types import is_numeric_dtype, is_string_dtype
+from pandas.api.types import is_timedelta64_dtype
 
 def check_data_structure(func):
     """Check if the data input to a function is a pandas DataFrame.
@@ -85,7 +87,9 @@ def check_missingness(func):
         This wrapper within the decorator does the actual verification. It
         checks that a DataFrame has both missing and real values. If the data
         is fully incomplete, an error is raised. If the data has datetime
-        columns that are not fully complete, an error is raised.
+        columns that are not fully complete, an error is raised. Only
+        tz-naive datetimes count as time series. String columns of any
+        string dtype, including nullable `string`, count as non-time series.
 
         Args:
             d (self, pd.DataFrame): data to check. should be a DataFrame
@@ -102,23 +106,29 @@ def check_missingness(func):
             ValueError: If any timeseries values in data are missing.
         """
         # b/c of check_data_structure, we know 1 of (d, a) is DataFrame
-        if isinstance(d, pd.DataFrame):
-            n_ts = d.select_dtypes(include=(np.number, np.object))
-            ts = d.select_dtypes(include=(np.datetime64,))
-        else:
-            a = args[0]
-            n_ts = a.select_dtypes(include=(np.number, np.object))
-            ts = a.select_dtypes(include=(np.datetime64,))
+        data = d if isinstance(d, pd.DataFrame) else args[0]
+
+        # split columns into time series and non-time series in one pass
+        # time series are tz-naive datetimes; tz-aware datetimes and bools
+        # are not checked, timedeltas count as numbers, as w/ select_dtypes
+        n_ts, ts = [], []
+        for c, dt in data.dtypes.items():
+            if is_datetime64_dtype(dt):
+                ts.append(c)
+            elif is_string_dtype(dt) or is_timedelta64_dtype(dt) or (
+                is_numeric_dtype(dt) and not is_bool_dtype(dt)
+            ):
+                n_ts.append(c)
 
         # check if non-time series columns are all missing, and if so, error
-        if n_ts.columns.any():
-            missing_nts = pd.isnull(n_ts.values)
+        if n_ts:
+            missing_nts = pd.isnull(data.loc[:, n_ts]).to_numpy()
             if missing_nts.all():
                 raise ValueError("All values missing, need some complete.")
 
         # check if any time series columns have missing data, and if so, error
-        if ts.columns.any():
-            missing_ts = pd.isnull(ts.values)
+        if ts:
+            missing_ts = pd.isnull(data.loc[:, ts]).to_numpy()
             if missing_ts.any():
                 raise ValueError("Time series columns must be fully complete.")
 
@@ -162,11 +172,9 @@ def check_nan_columns(func):
             ValueError: If all values in any column are missing.
         """
         # previous decorators ensure we are working with an accepted type
-        if isinstance(d, pd.DataFrame):
-            ndf = pd.isnull(d)
-        else:
-            ndf = pd.isnull(args[0])
-        nc = [c for c in ndf if ndf[c].all()]
+        data = d if isinstance(d, pd.DataFrame) else args[0]
+        all_nan = pd.isnull(data).to_numpy().all(axis=0)
+        nc = data.columns[all_nan].tolist()
         if nc:
             err = f"All values missing in column(s) {nc}. Should be removed."
             raise ValueError(err)
@@ -191,19 +199,19 @@ def check_strategy_allowed(strat_names, s):
         ValueError: Strategies not valid (not in allowed strategies).
         TypeError: Strategy must be a string, tuple, list, or dict.
     """
-    err_op = f"Strategies must be one of {list(strat_names)}."
+    strat_names = frozenset(strat_names)
     if isinstance(s, str):
         if s not in strat_names:
+            # error message only built if a strategy is actually invalid
             err = f"Strategy {s} not a valid imputation method.\n"
+            err_op = f"Strategies must be one of {sorted(strat_names)}."
             raise ValueError(f"{err} {err_op}")
     elif isinstance(s, (list, tuple, dict)):
-        if isinstance(s, dict):
-            ss = set(s.values())
-        else:
-            ss = set(s)
-        sdiff = ss.difference(strat_names)
+        ss = set(s.values()) if isinstance(s, dict) else set(s)
+        sdiff = ss - strat_names
         if sdiff:
             err = f"Strategies {sdiff} in {s} not valid imputation.\n"
+            err_op = f"Strategies must be one of {sorted(strat_names)}."
             raise ValueError(f"{err} {err_op}")
     else:
         raise TypeError("Strategy must be string, tuple, list, or dict.")
@@ -232,6 +240,8 @@ def check_strategy_fit(s, cols):
         ValueError (dict): keys of strategies and columns must match.
     """
     c_l = len(cols)
+    cols_set = frozenset(cols)
+
     # if strategy is string, extend strategy to all cols
     if isinstance(s, str):
         sf = {c:s for c in cols}
@@ -245,12 +255,12 @@ def check_strategy_fit(s, cols):
             err_c = f"Length of columns: {c_l}\n"
             err_s = f"Length of strategies: {s_l}"
             raise ValueError(f"{err}{err_c}{err_s}")
-        sf = {c[0]:c[1] for c in zip(cols, s)}
+        sf = dict(zip(cols, s))
 
     # if strategy is dict, ensure keys in strategy match cols in X
     # note that dict is preferred way to impute SOME columns and not all
     if isinstance(s, dict):
-        diff_s = set(s.keys()).difference(cols)
+        diff_s = s.keys() - cols_set
         if diff_s:
             err = "Keys of strategies and column names must match.\n"
             err_k = f"Ill-specified keys: {diff_s}"
@@ -284,9 +294,12 @@ def check_predictors_fit(predictors, cols):
         ValueError (dict, keys): keys of response must be columns in X.
         ValueError (dict, vals): vals of responses must be columns in X.
     """
+    # set of columns for constant time membership checks below
+    cols_set = frozenset(cols)
+
     # if string, value must be `all`, or else raise an error
     if isinstance(predictors, str):
-        if predictors != "all" and predictors not in cols:
+        if predictors != "all" and predictors not in cols_set:
             err = f"String {predictors} must be valid column in X.\n"
             err_all = "To use all columns, set predictors='all'."
             raise ValueError(f"{err}{err_all}")
@@ -294,7 +307,7 @@ def check_predictors_fit(predictors, cols):
 
     # if list or tuple, remove nan cols and check col names
     if isinstance(predictors, (list, tuple)):
-        bad_preds = [p for p in predictors if p not in cols]
+        bad_preds = [p for p in predictors if p not in cols_set]
         if bad_preds:
             err = f"{bad_preds} in predictors not a valid column in X."
             raise ValueError(err)
@@ -302,7 +315,7 @@ def check_predictors_fit(predictors, cols):
 
     # if dictionary, remove nan cols and check col names
     if isinstance(predictors, dict):
-        diff_s = set(predictors.keys()).difference(cols)
+        diff_s = predictors.keys() - cols_set
         if diff_s:
             err = "Keys of strategies and column names must match.\n"
             err_k = f"Ill-specified keys: {diff_s}"
@@ -310,11 +323,11 @@ def check_predictors_fit(predictors, cols):
         # then check the values of each key
         for k, preds in predictors.items():
             if isinstance(preds, str):
-                if preds != "all" and preds not in cols:
+                if preds != "all" and preds not in cols_set:
                     err = f"Invalid column as only predictor for {k}."
                     raise ValueError(err)
             elif isinstance(preds, (tuple, list)):
-                bad_preds = [p for p in preds if p not in cols]
+                bad_preds = [p for p in preds if p not in cols_set]
                 if bad_preds:
                     err = f"{bad_preds} for {k} not a valid column in X."
                     raise ValueError(err)
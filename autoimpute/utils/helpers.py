@@ -1,8 +1,8 @@
 """Helper functions used throughout other methods in automipute.utils."""
 
 import warnings
-import numpy as np
 import pandas as pd
+from pandas.api.types import is_string_dtype
 
 def _sq_output(data, cols, square=False):
     """Private method to turn unlabeled data into a DataFrame."""
@@ -29,21 +29,31 @@ def _nan_col_dropper(data):
         warnings.warn(wrn)
     return data, cdiff
 
+def _check_if_single_dummy(col, cats):
+    """Private method to warn if a feature has only a single category."""
+    if len(cats) == 1:
+        msg = f"{cats[0]} only category for feature {col}."
+        cons = f"Consider removing {col} from dataset."
+        warnings.warn(f"{msg} {cons}")
+
 def _one_hot_encode(X, used_columns=None):
     """Private method to handle one hot encoding for categoricals."""
-    cats = X.select_dtypes(include=(np.object,)).columns.size
-    if cats > 0:
-        X_temp = pd.get_dummies(X, drop_first=True)
+    cats = [c for c, dt in X.dtypes.items() if is_string_dtype(dt)]
+    if cats:
         if used_columns is None:
-            used_columns = X_temp.columns
-        if len(X_temp.columns) != len(used_columns):
-            one_hot = pd.get_dummies(X)
+            # single category features encode to nothing once first dropped
+            # so skip encoding them altogether, warning about each one
+            single = []
+            for col in cats:
+                uniq = X[col].dropna().unique()
+                if len(uniq) <= 1:
+                    single.append(col)
+                    _check_if_single_dummy(col, uniq)
+            X = pd.get_dummies(X.drop(columns=single), drop_first=True)
+        else:
+            # encode once and align to `used_columns` in the same pass
             # if wasn't in `used_columns`, then it's the first category
-            to_drop = set(one_hot.columns).difference(used_columns)
-            one_hot.drop(to_drop, axis=1, inplace=True)
-            # if wasn't in `one_hot`, there were no instances of this category
-            to_add = set(used_columns).difference(one_hot.columns)
-            X_temp = one_hot.assign(**{col:0 for col in to_add})
-            X_temp = X_temp.reindex(columns=used_columns, copy=False)
-        X = X_temp
+            # if wasn't in the encoding, there were no instances of it
+            one_hot = pd.get_dummies(X)
+            X = one_hot.reindex(columns=used_columns, fill_value=0)
     return X
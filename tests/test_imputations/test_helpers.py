@@ -0,0 +1,59 @@
+"""Tests written to ensure the helpers in the imputations package work.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `_get_observed` drops rows missing in predictors or series.
+- `_get_observed` accepts predictors as a Series.
+- `_get_observed` raises when a column is fully missing.
+- `_get_observed` raises when no rows are fully observed.
+- `_get_observed` prints the same summary as `listwise_delete`.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from autoimpute.imputations.helpers import _get_observed
+from autoimpute.imputations.deletion import listwise_delete
+
+x_obs = pd.DataFrame({
+    "a": [1.0, np.nan, 3.0, 4.0, 5.0],
+    "b": [1.0, 2.0, 3.0, np.nan, 5.0]
+}, index=[10, 11, 12, 13, 14])
+y_obs = pd.Series([1.0, 2.0, np.nan, 4.0, 5.0], index=x_obs.index, name="y")
+
+def test_get_observed_frame():
+    """Test rows missing in predictors or series are removed."""
+    x, y = _get_observed(x_obs, y_obs)
+    assert list(x.index) == [10, 14]
+    assert list(y.index) == [10, 14]
+    assert list(x.columns) == ["a", "b"]
+    assert y.name == "y"
+
+def test_get_observed_series():
+    """Test predictors passed as a Series are converted to a DataFrame."""
+    x, y = _get_observed(x_obs["a"], y_obs)
+    assert isinstance(x, pd.DataFrame)
+    assert list(x.columns) == ["a"]
+    assert list(x.index) == [10, 13, 14]
+    assert list(y.index) == [10, 13, 14]
+
+def test_get_observed_all_missing_column():
+    """Test error raised when a predictor or the series is fully missing."""
+    x = x_obs.assign(c=np.nan)
+    with pytest.raises(ValueError, match="All values missing"):
+        _get_observed(x, y_obs)
+    with pytest.raises(ValueError, match="All values missing"):
+        _get_observed(x_obs, pd.Series(np.nan, index=x_obs.index, name="y"))
+
+def test_get_observed_no_rows():
+    """Test error raised when no rows are fully observed."""
+    x = pd.DataFrame({"a": [1.0, np.nan], "b": [np.nan, 2.0]})
+    y = pd.Series([1.0, 2.0], name="y")
+    with pytest.raises(ValueError, match="No rows fully observed"):
+        _get_observed(x, y)
+
+def test_get_observed_verbose(capsys):
+    """Test verbose output matches listwise_delete."""
+    _get_observed(x_obs, y_obs, verbose=True)
+    observed = capsys.readouterr().out
+    listwise_delete(pd.concat([x_obs, y_obs], axis=1), verbose=True)
+    assert observed == capsys.readouterr().out
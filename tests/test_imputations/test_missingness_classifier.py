@@ -2,8 +2,14 @@
 
 Tests use the pytest library. The tests in this module ensure the following:
 - `test_missing_classifier` tests that bug in issue 56 is fixed
+- `test_string_column` tests fit and predict with an object/str column
+- `test_unseen_category` tests unseen categories encode as NaN, not -1
+- `test_dict_predictors` tests predictors passed as a dictionary
+- `test_index_and_column_order` tests non-RangeIndex & reordered columns
 """
 
+import numpy as np
+import pandas as pd
 from autoimpute.imputations import MissingnessClassifier
 from autoimpute.utils import dataframes
 dfs = dataframes
@@ -16,3 +22,53 @@ def test_single_missing_column():
     imp = MissingnessClassifier()
     imp.fit_predict(dfs.df_mis_classifier)
     imp.fit_predict_proba(dfs.df_mis_classifier)
+
+
+def test_string_column():
+    """Test that the classifier fits and predicts with a string column"""
+    imp = MissingnessClassifier()
+    preds = imp.fit_predict(dfs.df_mix)
+    assert "gender" in imp._categories
+    assert list(preds.columns) == [f"{c}_pred" for c in dfs.df_mix.columns]
+    assert len(preds) == len(dfs.df_mix)
+
+
+def test_unseen_category():
+    """Test that categories unseen during fit are encoded as NaN"""
+    imp = MissingnessClassifier()
+    imp.fit(dfs.df_mix)
+    X = dfs.df_mix.copy()
+    X.loc[X.index[:5], "gender"] = "Other"
+    xs = imp._encode_predictors(X)
+    gender = xs[:, list(X.columns).index("gender")]
+    assert np.isnan(gender[:5]).all()
+    assert not (gender == -1).any()
+    assert len(imp.predict(X)) == len(X)
+
+
+def test_dict_predictors():
+    """Test that predictors passed as a dictionary are respected"""
+    imp = MissingnessClassifier(predictors={"a": ["c"], "k": ["a", "c"]})
+    imp.fit(dfs.df_mis_classifier)
+    cols = dfs.df_mis_classifier.columns
+    assert list(imp._pred_pos["a"]) == [cols.get_loc("c")]
+    assert list(imp._pred_pos["k"]) == [cols.get_loc("a"), cols.get_loc("c")]
+    preds = imp.predict_proba(dfs.df_mis_classifier)
+    assert isinstance(preds, pd.DataFrame)
+    assert preds.shape == dfs.df_mis_classifier.shape
+
+
+def test_index_and_column_order():
+    """Test output keeps X's index and the column order used during fit"""
+    X = dfs.df_mis_classifier.copy()
+    X.index = X.index + 1000
+    imp = MissingnessClassifier()
+    imp.fit(X)
+    X_reorder = X[X.columns[::-1]]
+    preds = imp.predict_proba(X_reorder)
+    assert preds.index.equals(X.index)
+    assert list(preds.columns) == [f"{c}_pred" for c in X.columns]
+    imp.gen_test_indices(X)
+    for c, ix in imp.test_indices.items():
+        assert ix.isin(X.index).all()
+        assert not X.loc[ix, c].isnull().any()
@@ -0,0 +1,88 @@
+"""Tests written to ensure the series imputers in the imputations package work.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `test_impute_many_draws_from_own_column` draws come from each column.
+- `test_impute_many_no_observed` throw error if column has nothing observed.
+- `test_impute_many_seed` test imputations reproducible with a seed.
+- `test_median_impute` test median of observed returned as scalar.
+- `test_random_imputer_seed` test random draws reproducible with a seed.
+- `test_random_imputer_cached_rng` test seeded generator reused until refit.
+- `test_ndarray_input` test np.ndarray and pd.Series give the same result.
+- `test_not_num_ndarray` test type error raised for unnamed ndarray.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from autoimpute.imputations.series import MedianImputer, RandomImputer
+from autoimpute.imputations.errors import _not_num_series
+
+df_many = pd.DataFrame({
+    "A": [1.0, np.nan, 3.0, np.nan, 5.0],
+    "B": [np.nan, 10.0, 20.0, np.nan, 30.0],
+    "C": [-1.0, -2.0, -3.0, -4.0, -5.0]
+})
+
+def test_impute_many_draws_from_own_column():
+    """Test each imputation is drawn from the observed values of its column."""
+    imputed = RandomImputer().impute_many(df_many)
+    assert not np.isnan(imputed).any()
+    for i, col in enumerate(df_many):
+        observed = set(df_many[col].dropna())
+        assert set(imputed[:, i]) <= observed
+    assert np.array_equal(imputed[:, 2], df_many["C"].values)
+
+def test_impute_many_no_observed():
+    """Test that a column with missing data and nothing observed errors."""
+    X = np.array([[1.0, np.nan], [2.0, np.nan]])
+    with pytest.raises(ValueError):
+        RandomImputer().impute_many(X)
+
+def test_impute_many_seed():
+    """Test that imputations are the same when a seed is given."""
+    first = RandomImputer(seed=7).impute_many(df_many)
+    second = RandomImputer(seed=7).impute_many(df_many)
+    assert np.array_equal(first, second)
+
+@pytest.mark.parametrize("s", [
+    pd.Series([1.0, np.nan, 3.0, np.nan, 10.0]),
+    pd.Series([1, None, 3, None, 10], dtype="Int64")
+])
+def test_median_impute(s):
+    """Test that impute returns the median of observed data as a scalar."""
+    imp = MedianImputer().fit_impute(s)
+    assert np.ndim(imp) == 0
+    assert imp == 3.0
+
+def test_random_imputer_seed():
+    """Test that random draws are the same when a seed is given."""
+    s = pd.Series([1.0, np.nan, 3.0, np.nan, 5.0, np.nan, 7.0])
+    first = RandomImputer(seed=11).fit_impute(s)
+    second = RandomImputer(seed=11).fit_impute(s)
+    assert len(first) == 3
+    assert np.array_equal(first, second)
+    assert set(first) <= set(s.dropna())
+
+def test_random_imputer_cached_rng():
+    """Test a seeded imputer reuses one generator until it is fit again."""
+    s = pd.Series(np.r_[np.arange(100.0), np.full(50, np.nan)])
+    imp = RandomImputer(seed=11).fit(s)
+    first = imp.impute(s)
+    second = imp.impute(s)
+    assert not np.array_equal(first, second)
+    assert np.array_equal(imp.fit(s).impute(s), first)
+
+@pytest.mark.parametrize("imp", [MedianImputer(), RandomImputer(seed=5)])
+def test_ndarray_input(imp):
+    """Test that fit_impute is the same for np.ndarray and pd.Series."""
+    s = pd.Series([1.0, np.nan, 3.0, np.nan, 10.0, 4.0])
+    from_series = imp.fit_impute(s)
+    from_array = imp.fit_impute(s.to_numpy())
+    assert np.array_equal(from_series, from_array)
+
+def test_not_num_ndarray():
+    """Test that an unnamed, non-numerical ndarray raises a TypeError."""
+    with pytest.raises(TypeError):
+        _not_num_series("median", np.array(["a", "b"]))
+    with pytest.raises(TypeError):
+        MedianImputer().fit(np.array(["a", "b"]))
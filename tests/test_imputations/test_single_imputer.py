@@ -14,9 +14,13 @@ Tests use the pytest library. The tests in this module ensure the following:
 - `test_bayesian_logistic_imputer` test bayesian logistic strategy.
 - `test_pmm_lrd_imputer` test pmm and lrd strategy.
 - `test_normal_unit_variance_imputer` test unit variance imputer
+- `test_random_imputer_seed` test repeated transforms reproducible w/ seed.
+- `test_univar_imputers_imp_ixs` test univariate imputers using `imp_ixs`.
 """
 
 import pytest
+import numpy as np
+import pandas as pd
 from autoimpute.imputations import SingleImputer
 from autoimpute.utils import dataframes
 dfs = dataframes
@@ -151,3 +155,26 @@ def test_partial_dependence_imputer():
     """Test to ensure that edge case for partial dependence whandled"""
     imp = SingleImputer(strategy='stochastic')
     imp.fit_transform(dfs.df_partial_dependence)
+
+def test_random_imputer_seed():
+    """Test repeated transforms give the same imputations with a seed."""
+    imp = SingleImputer(strategy="random", seed=3)
+    imp.fit(dfs.df_num)
+    first = imp.transform(dfs.df_num)
+    second = imp.transform(dfs.df_num)
+    assert first.equals(second)
+
+@pytest.mark.parametrize("strategy", ["mean", "median"])
+def test_univar_imputers_imp_ixs(strategy):
+    """Test univariate imputers impute locations given by `imp_ixs`."""
+    df = pd.DataFrame({
+        "a": [1.0, 2.0, np.nan, 5.0],
+        "b": [np.nan, 4.0, 6.0, 8.0]
+    })
+    imp = SingleImputer(strategy=strategy)
+    imp.fit(df)
+    imputed = imp.transform(df, imp_ixs={"a": [0, 1], "b": [2, 3]})
+    fill = df.agg(strategy)
+    assert imputed.loc[[0, 1], "a"].eq(fill["a"]).all()
+    assert imputed.loc[[2, 3], "b"].eq(fill["b"]).all()
+    assert imp.imputed_ == {"a": [0, 1], "b": [2, 3]}
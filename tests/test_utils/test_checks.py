@@ -7,6 +7,7 @@ Tests use the pytest library. The tests in this module ensure the following:
 - `check_missingness` raises errors for fully missing datasets.
 - `check_missingness` raises errors for time series missing in datasets.
 - `remove_nan_columns` removes columns if the entire column is missing.
+- `check_missingness` classifies datetime and timedelta columns by dtype.
 """
 
 import pytest
@@ -154,3 +155,32 @@ def test_nan_columns():
     assert pd.isnull(df["C"]).all()
     with pytest.raises(ValueError):
         check_nan_cols(df)
+
+def test_missingness_time_dtypes():
+    """Check how `check_missingness` treats datetime & timedelta columns.
+
+    Only tz-naive datetimes count as time series, so missing values in them
+    raise an error while missing values in tz-aware datetimes do not.
+    Timedeltas count as numbers, so a fully missing timedelta column with no
+    other data raises an error for all values missing.
+
+    Args:
+        None: DataFrames hard-coded internally.
+
+    Returns:
+        None: asserts errors raised only for the expected dtypes.
+    """
+    dates = ["2018-05-01", None, "2018-05-03"]
+    stats = [3, np.nan, 5]
+    df_naive = pd.DataFrame({"date": pd.to_datetime(dates), "stats": stats})
+    with pytest.raises(ValueError):
+        check_miss(df_naive)
+
+    df_aware = pd.DataFrame({
+        "date": pd.to_datetime(dates, utc=True), "stats": stats
+    })
+    assert check_miss(df_aware) is df_aware
+
+    df_td = pd.DataFrame({"td": pd.to_timedelta([None, None], unit="D")})
+    with pytest.raises(ValueError, match="All values missing"):
+        check_miss(df_td)
@@ -0,0 +1,32 @@
+"""Tests written to ensure the helpers in the utils package work correctly.
+
+Tests use the pytest library. The tests in this module ensure the following:
+- `_one_hot_encode` drops & warns about single category features on fit.
+- `_one_hot_encode` keeps single category features on transform.
+"""
+
+import pytest
+import pandas as pd
+from autoimpute.utils.helpers import _one_hot_encode
+
+df_fit = pd.DataFrame({
+    "num": [1, 2, 3, 4],
+    "cat": ["x", "y", "z", "x"],
+    "single": ["q", None, "q", "q"]
+})
+
+def test_one_hot_single_category_fit():
+    """Test single category feature is dropped and warns on fit."""
+    with pytest.warns(UserWarning, match="q only category for feature"):
+        encoded = _one_hot_encode(df_fit)
+    assert encoded.columns.tolist() == ["num", "cat_y", "cat_z"]
+
+def test_one_hot_single_category_transform():
+    """Test single category feature is not dropped on transform."""
+    df_train = df_fit.assign(single=["q", "r", "q", "q"])
+    used = _one_hot_encode(df_train).columns
+    assert "single_r" in used
+    df_new = df_fit.assign(single=["r", "r", None, "r"])
+    encoded = _one_hot_encode(df_new, used)
+    assert encoded.columns.tolist() == used.tolist()
+    assert encoded["single_r"].tolist() == [1, 1, 0, 1]